@@ -1,47 +1,18 @@
 import argparse
-import os
-from datetime import datetime
-from pathlib import Path
 
-import pandas as pd
-from dateutil import tz
-from dotenv import load_dotenv
-
-from .scraping_manager import Scraper
-from .src.utils.gcp_spreadsheet import GcpSpreadSheet
-from .src.utils.logger import get_logger
+from .api_server import serve_api
+from .daemon import ScrapingDaemon
+from .runner import run_case
+from .src.utils.logger import configure_logging, get_logger
 
 logger = get_logger(__name__)
 
-# Load environment variables from .env file if it exists
-script_dir = Path(__file__).parent
-env_path = script_dir / ".env"
-if env_path.exists():
-    load_dotenv(dotenv_path=env_path)
-
-# Get Google Maps API key from environment variables
-google_maps_api_key = os.environ.get("GOOGLE_MAPS_API_KEY")
-
-jst = tz.gettz("Asia/Tokyo")
-now_jst = datetime.now(jst)
-yyyymmdd = int(now_jst.strftime("%Y%m%d"))
-
-
-def _output_csv(df: pd.DataFrame, dir_path: str) -> None:
-    # 相対パスの場合、スクリプトのディレクトリを基準に解決
-    if not os.path.isabs(dir_path):
-        dir_path = str(script_dir / dir_path)
-
-    os.makedirs(dir_path, exist_ok=True)
-    filename = os.path.join(dir_path, f"{yyyymmdd}.csv")
-    df.to_csv(filename, index=False)
-
 
 def main():
     parser = argparse.ArgumentParser(
         description="Scrape SUUMO data and optionally update Google Spreadsheet"
     )
-    parser.add_argument("case_name", help="Case name for scraping")
+    parser.add_argument("case_name", nargs="?", help="Case name for scraping")
     parser.add_argument(
         "--skip-spreadsheet",
         action="store_true",
@@ -62,84 +33,56 @@ def main():
         action="store_true",
         help="Test run mode: scrape only 1 page. Nothing skipped, but written to 'test' sheet.",
     )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="Output logs as JSON lines",
+    )
+    parser.add_argument(
+        "--export-tiles",
+        action="store_true",
+        help="Export df_mart as GeoJSON and update map tiles for changed listings",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Daemon mode: run all targets on the schedules defined in setting.yml",
+    )
+    parser.add_argument(
+        "--serve-api",
+        action="store_true",
+        help="Serve a local read API over the latest df_mart of every case",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="Port of the local endpoint (default: 8765 for --serve, 8766 for --serve-api)",
+    )
     args = parser.parse_args()
 
-    case_name = args.case_name
+    if args.case_name is None and not (args.serve or args.serve_api):
+        parser.error("case_name is required unless --serve or --serve-api is specified")
 
-    # Dry run/Test runモードの場合、max_page=1に設定
-    max_page = 1 if args.dry_run or args.test_run else 1000
+    # ログ出力はバックグラウンドスレッドで行い、行ごとの高頻度なログは集約する
+    configure_logging(json_format=args.log_json)
 
-    if args.dry_run:
-        logger.info("=== DRY RUN MODE ===")
-        logger.info("- Scraping only 1 page")
-        logger.info("- CSV saving disabled")
-        logger.info("- Google Spreadsheet update disabled")
-        logger.info("=" * 20)
+    if args.serve:
+        ScrapingDaemon(port=args.port or 8765).serve_forever()
+        return
 
-    if args.test_run:
-        logger.info("=== TEST RUN MODE ===")
-        logger.info("- Scraping only 1 page")
-        logger.info("- Data will be written to 'test' sheet in Google Spreadsheet")
-        logger.info("=" * 20)
+    if args.serve_api:
+        serve_api(port=args.port or 8766)
+        return
 
-    scraper = Scraper(case_name)
-    scraper.extract_page(max_page=max_page)  # スクレイピング
-    scraper.format_data()  # スクレイピング結果を整形
-    scraper.remove_replications(
-        group_cols=["price", "age", "area", "station_name"]
-    )  # grouping処理を行う
-
-    # 緯度・経度を追加してdf_martを作成
-    if not args.dry_run and google_maps_api_key is not None:
-        scraper.add_coordinates(google_maps_api_key)
-    else:
-        scraper.add_coordinates(
-            google_maps_api_key, is_dry_run=True
-        )  # "lat"と"lon"にNoneを設定
-
-    # 結果データフレームをcsvに保存
-    # Dry runモードの場合は`data_dry/`ディレクトリに保存
-    if not args.skip_csv_storing and not args.dry_run:
-        _output_csv(scraper.df_lake, f"data/{case_name}/lake")
-        _output_csv(
-            scraper.df_formatted.sort_values("id"), f"data/{case_name}/formatted"
-        )
-        _output_csv(scraper.df_mart.sort_values("id"), f"data/{case_name}/mart")
-    else:
-        _output_csv(scraper.df_lake, f"data_dry/{case_name}/lake")
-        _output_csv(
-            scraper.df_formatted.sort_values("id"), f"data_dry/{case_name}/formatted"
-        )
-        _output_csv(scraper.df_mart.sort_values("id"), f"data_dry/{case_name}/mart")
-
-    # Google Spreadsheetを更新
-    # Dry runモードの場合はスキップ
-    if not args.skip_spreadsheet and not args.dry_run:
-        logger.info("Updating Google Spreadsheet...")
-        # dfにタイムスタンプのカラムを追加
-        df_gss = scraper.df_mart.sort_values("id").copy()
-        df_gss["updated_at"] = now_jst.strftime("%Y-%m-%d %H:%M:%S")
-        filename_credentials = str(script_dir / "credentials.json")
-
-        # 環境変数からスプレッドシートキーを取得
-        spreadsheet_key = os.environ.get("GOOGLE_SPREAD_SHEET_KEY")
-        if not spreadsheet_key:
-            raise ValueError(
-                "GOOGLE_SPREAD_SHEET_KEY environment variable is not set. "
-                "Please set it before running this script."
-            )
-
-        spreadsheet = GcpSpreadSheet(
-            key=spreadsheet_key,
-            filename_credentials=filename_credentials,
-        )
-        sheet_name = (
-            "test" if args.test_run else "latest"
-        )  # テストランの場合はlatest_testシートに書き込む
-        spreadsheet.dump_dataframe(
-            df=df_gss,
-            sheet_name=sheet_name,
-        )
+    run_case(
+        args.case_name,
+        skip_spreadsheet=args.skip_spreadsheet,
+        skip_csv_storing=args.skip_csv_storing,
+        dry_run=args.dry_run,
+        test_run=args.test_run,
+        export_tiles=args.export_tiles,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,211 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from .src.core.mart_index import MartIndex
+from .src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+# 1リクエストで返す最大件数
+MAX_LIMIT = 1000
+
+
+class MartStore:
+    """全caseの最新のdf_martをメモリ上に保持し、新しいスナップショットを検知して再読み込みする
+
+    Args:
+        data_dir (str): `{case_name}/mart/{yyyymmdd}.csv`を含むディレクトリ
+    """
+
+    def __init__(self, data_dir: str = DATA_DIR) -> None:
+        self.data_dir = data_dir
+        self.index: MartIndex | None = None
+        # caseごとに読み込んだスナップショットのファイル名
+        self.snapshots: dict[str, str] = {}
+        self._signature: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _latest_snapshots(self) -> dict[str, str]:
+        """caseごとの最新のmart CSVのパスを返す"""
+        snapshots = {}
+        if not os.path.isdir(self.data_dir):
+            return snapshots
+        for case_name in sorted(os.listdir(self.data_dir)):
+            mart_dir = os.path.join(self.data_dir, case_name, "mart")
+            if not os.path.isdir(mart_dir):
+                continue
+            filenames = sorted(f for f in os.listdir(mart_dir) if f.endswith(".csv"))
+            if filenames:
+                snapshots[case_name] = os.path.join(mart_dir, filenames[-1])
+        return snapshots
+
+    def reload_if_changed(self) -> bool:
+        """最新のスナップショットが変わっていれば再読み込みする
+
+        Returns:
+            bool: 再読み込みした場合はTrue
+        """
+        snapshots = self._latest_snapshots()
+        # ファイル名に加えて更新時刻も比較し、同日の再実行による上書きも検知する
+        signature = {
+            case: f"{path}:{os.path.getmtime(path)}" for case, path in snapshots.items()
+        }
+        if signature == self._signature:
+            return False
+
+        dfs = [
+            pd.read_csv(path, dtype={"id": str}).assign(case=case)
+            for case, path in snapshots.items()
+        ]
+        df = pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+        index = MartIndex(df) if not df.empty else None
+        with self._lock:
+            self.index = index
+            self.snapshots = {
+                case: os.path.basename(path) for case, path in snapshots.items()
+            }
+            self._signature = signature
+        logger.info(f"Loaded {len(df)} records: {self.snapshots}")
+        return True
+
+    def get_index(self) -> MartIndex | None:
+        with self._lock:
+            return self.index
+
+
+def _parse_query(query: dict) -> dict:
+    """クエリパラメータをMartIndex.queryの引数に変換する
+
+    Raises:
+        ValueError: パラメータの値が不正な場合
+    """
+
+    def _list(key: str) -> list | None:
+        values = [v for value in query.get(key, []) for v in value.split(",") if v]
+        return values or None
+
+    def _number(key: str) -> float | None:
+        value = query.get(key, [None])[0]
+        return None if value is None else float(value)
+
+    filters = {}
+    params = [("case", "case"), ("station", "station_name"), ("line", "line")]
+    for param, col in params:
+        values = _list(param)
+        if values is not None:
+            filters[col] = values
+
+    ranges = {}
+    for col in ["price", "area"]:
+        min_value, max_value = _number(f"min_{col}"), _number(f"max_{col}")
+        if min_value is not None or max_value is not None:
+            ranges[col] = (min_value, max_value)
+
+    limit = int(query.get("limit", ["50"])[0])
+    offset = int(query.get("offset", ["0"])[0])
+    if not 0 < limit <= MAX_LIMIT or offset < 0:
+        raise ValueError(f"limitは1〜{MAX_LIMIT}、offsetは0以上を指定してください")
+
+    return {
+        "filters": filters,
+        "ranges": ranges,
+        "sort": query.get("sort", [None])[0],
+        "limit": limit,
+        "offset": offset,
+    }
+
+
+def _make_handler(store: MartStore) -> type:
+    """APIのリクエストハンドラを作成する"""
+
+    class _Handler(BaseHTTPRequestHandler):
+        def _send_json(self, code: int, data: dict) -> None:
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            if url.path == "/cases":
+                self._send_json(200, store.snapshots)
+                return
+            if url.path != "/listings":
+                self._send_json(404, {"error": "not found"})
+                return
+
+            index = store.get_index()
+            if index is None:
+                self._send_json(503, {"error": "no snapshot loaded"})
+                return
+            try:
+                params = _parse_query(parse_qs(url.query))
+                total, items = index.query(**params)
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            self._send_json(
+                200,
+                {
+                    "total": total,
+                    "limit": params["limit"],
+                    "offset": params["offset"],
+                    "items": items,
+                },
+            )
+
+        def log_message(self, format: str, *args) -> None:
+            logger.debug(format % args)
+
+    return _Handler
+
+
+def serve_api(
+    host: str = "127.0.0.1", port: int = 8766, reload_interval: float = 10.0
+) -> None:
+    """最新のdf_martに対する読み取り専用のHTTP APIを起動する
+
+    エンドポイント:
+        GET /cases     読み込んでいるcaseとスナップショットを返す
+        GET /listings  条件に一致する物件を返す
+            case, station, line: カンマ区切りで複数指定可能
+            min_price, max_price, min_area, max_area: 範囲指定
+            sort: id, price, area, age, minutes（先頭に`-`で降順）
+            limit, offset: ページング（limitは最大1000）
+
+    Args:
+        host (str): ホスト
+        port (int): ポート
+        reload_interval (float): 新しいスナップショットを確認する間隔（秒）
+    """
+    store = MartStore()
+    store.reload_if_changed()
+    stop = threading.Event()
+
+    def _watch() -> None:
+        while not stop.wait(timeout=reload_interval):
+            try:
+                store.reload_if_changed()
+            except Exception as e:
+                # 書き込み途中のCSVなどで失敗した場合は、現在のインデックスを使い続ける
+                logger.warning(f"スナップショットの再読み込みに失敗しました: {e}")
+
+    threading.Thread(target=_watch, name="reloader", daemon=True).start()
+    server = ThreadingHTTPServer((host, port), _make_handler(store))
+    logger.info(f"Serving read API on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping...")
+    finally:
+        stop.set()
+        server.server_close()
@@ -0,0 +1,247 @@
+import json
+import os
+import queue
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from .runner import create_spreadsheet, jst, run_case
+from .src.core.watchlist import validate_watchlists
+from .src.utils.cron import CronSchedule
+from .src.utils.gcp_spreadsheet import GcpSpreadSheet
+from .src.utils.logger import get_logger
+from .src.utils.yaml_handler import load_yaml
+
+logger = get_logger(__name__)
+
+# scheduleで指定可能なrun_caseのオプション
+_SCHEDULE_OPTIONS = {"skip_spreadsheet", "skip_csv_storing", "export_tiles"}
+
+
+class ScrapingDaemon:
+    """setting.ymlの全targetをcron形式のスケジュールで実行する常駐プロセス
+
+    HTTPセッション、geocodingのCache、GcpSpreadSheetのクライアント、
+    ホストごとのレート制限を実行間で共有します。
+    ジョブは1つのワーカースレッドで順番に実行されます。
+
+    ローカルの制御用エンドポイント:
+        GET  /status         全caseの状態を返す
+        GET  /status/<case>  指定したcaseの状態を返す
+        POST /run/<case>     指定したcaseを即時実行する
+
+    Args:
+        host (str): 制御用エンドポイントのホスト
+        port (int): 制御用エンドポイントのポート
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        _filename_setting = os.path.join(os.path.dirname(__file__), "setting.yml")
+        self.data_setting = load_yaml(_filename_setting)
+        self.host = host
+        self.port = port
+
+        # 実行間で共有するリソース
+        self.session = requests.Session()
+        self._spreadsheet: GcpSpreadSheet | None = None
+
+        # caseごとのスケジュール・オプション・状態
+        self.schedules: dict[str, CronSchedule] = {}
+        self.options: dict[str, dict] = {}
+        self.status: dict[str, dict] = {}
+        now = datetime.now(jst)
+        for case_name, data_target in self.data_setting["target"].items():
+            schedule = dict(data_target.get("schedule") or {})
+            cron = schedule.pop("cron", None)
+            unknown = set(schedule) - _SCHEDULE_OPTIONS
+            if unknown:
+                raise ValueError(
+                    f"'{case_name}'のscheduleに未知のオプションが含まれています: "
+                    f"{sorted(unknown)}"
+                )
+            validate_watchlists(data_target.get("watchlists") or {})
+            self.options[case_name] = schedule
+            self.status[case_name] = {
+                "schedule": cron,
+                "next_run": None,
+                "state": "idle",
+                "last_started": None,
+                "last_finished": None,
+                "last_result": None,
+                "last_error": None,
+            }
+            if cron is not None:
+                schedule = CronSchedule(cron)
+                self.schedules[case_name] = schedule
+                self.status[case_name]["next_run"] = schedule.next_after(now)
+
+        self._lock = threading.Lock()
+        self._jobs: queue.Queue = queue.Queue()
+        self._stop = threading.Event()
+
+    def _get_spreadsheet(self) -> GcpSpreadSheet:
+        """GcpSpreadSheetを初回のみ作成し、以降は再利用する"""
+        if self._spreadsheet is None:
+            self._spreadsheet = create_spreadsheet()
+        return self._spreadsheet
+
+    def trigger(self, case_name: str) -> bool:
+        """caseを実行キューに追加する
+
+        Args:
+            case_name (str): 実行するcase名
+
+        Returns:
+            bool: キューに追加した場合はTrue。既に実行待ち・実行中の場合はFalse
+
+        Raises:
+            KeyError: setting.ymlに存在しないcase名の場合
+        """
+        with self._lock:
+            status = self.status[case_name]
+            if status["state"] != "idle":
+                return False
+            status["state"] = "queued"
+        self._jobs.put(case_name)
+        logger.info(f"Queued: {case_name}")
+        return True
+
+    def get_status(self, case_name: str | None = None) -> dict:
+        """caseの状態をJSONに変換可能な辞書で返す"""
+        with self._lock:
+            if case_name is not None:
+                return _serialize(self.status[case_name])
+            return {name: _serialize(s) for name, s in self.status.items()}
+
+    def _run_job(self, case_name: str) -> None:
+        with self._lock:
+            self.status[case_name]["state"] = "running"
+            self.status[case_name]["last_started"] = datetime.now(jst)
+        options = self.options[case_name]
+        logger.info(f"Running: {case_name} {options}")
+        try:
+            spreadsheet = None
+            if not options.get("skip_spreadsheet"):
+                spreadsheet = self._get_spreadsheet()
+            run_case(
+                case_name,
+                data_setting=self.data_setting,
+                session=self.session,
+                spreadsheet=spreadsheet,
+                **options,
+            )
+            result, error = "success", None
+        except Exception as e:
+            # 1つのcaseの失敗で常駐プロセスを止めない
+            logger.exception(f"Failed: {case_name}: {e}")
+            result, error = "failed", str(e)
+        with self._lock:
+            self.status[case_name].update(
+                state="idle",
+                last_finished=datetime.now(jst),
+                last_result=result,
+                last_error=error,
+            )
+        logger.info(f"Finished: {case_name} ({result})")
+
+    def _worker(self) -> None:
+        while not self._stop.is_set():
+            try:
+                case_name = self._jobs.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            self._run_job(case_name)
+
+    def _scheduler(self) -> None:
+        while not self._stop.is_set():
+            now = datetime.now(jst)
+            for case_name, schedule in self.schedules.items():
+                with self._lock:
+                    next_run = self.status[case_name]["next_run"]
+                    if next_run > now:
+                        continue
+                    self.status[case_name]["next_run"] = schedule.next_after(now)
+                if not self.trigger(case_name):
+                    logger.warning(f"Skipped: {case_name} is already queued or running")
+            self._stop.wait(timeout=max(0.0, 60 - now.second - now.microsecond / 1e6))
+
+    def serve_forever(self) -> None:
+        """スケジューラ・ワーカー・制御用エンドポイントを起動し、停止されるまで待機する"""
+        server = ThreadingHTTPServer((self.host, self.port), _make_handler(self))
+        threads = [
+            threading.Thread(target=self._worker, name="worker", daemon=True),
+            threading.Thread(target=self._scheduler, name="scheduler", daemon=True),
+            threading.Thread(target=server.serve_forever, name="control", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        logger.info(f"Serving control endpoint on http://{self.host}:{self.port}")
+        for case_name, status in self.get_status().items():
+            logger.info(f"{case_name}: schedule={status['schedule']}")
+
+        try:
+            self._stop.wait()
+        except KeyboardInterrupt:
+            logger.info("Stopping...")
+        finally:
+            self._stop.set()
+            server.shutdown()
+            server.server_close()
+
+    def stop(self) -> None:
+        """常駐プロセスを停止する。実行中のジョブは完了まで待たない"""
+        self._stop.set()
+
+
+def _serialize(status: dict) -> dict:
+    return {
+        k: v.isoformat() if isinstance(v, datetime) else v for k, v in status.items()
+    }
+
+
+def _make_handler(daemon: ScrapingDaemon) -> type:
+    """制御用エンドポイントのリクエストハンドラを作成する"""
+
+    class _Handler(BaseHTTPRequestHandler):
+        def _send_json(self, code: int, data: dict) -> None:
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            parts = self.path.strip("/").split("/")
+            if parts == ["status"]:
+                self._send_json(200, daemon.get_status())
+            elif len(parts) == 2 and parts[0] == "status":
+                try:
+                    self._send_json(200, daemon.get_status(parts[1]))
+                except KeyError:
+                    self._send_json(404, {"error": f"unknown case: {parts[1]}"})
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            parts = self.path.strip("/").split("/")
+            if len(parts) != 2 or parts[0] != "run":
+                self._send_json(404, {"error": "not found"})
+                return
+            try:
+                queued = daemon.trigger(parts[1])
+            except KeyError:
+                self._send_json(404, {"error": f"unknown case: {parts[1]}"})
+                return
+            if queued:
+                self._send_json(202, {"queued": parts[1]})
+            else:
+                error = f"already queued or running: {parts[1]}"
+                self._send_json(409, {"error": error})
+
+        def log_message(self, format: str, *args) -> None:
+            logger.debug(format % args)
+
+    return _Handler
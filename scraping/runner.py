@@ -0,0 +1,221 @@
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import requests
+from dateutil import tz
+from dotenv import load_dotenv
+
+from .scraping_manager import Scraper
+from .src.core.tile_exporter import export_geojson, update_tiles
+from .src.utils.gcp_spreadsheet import GcpSpreadSheet
+from .src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Load environment variables from .env file if it exists
+script_dir = Path(__file__).parent
+env_path = script_dir / ".env"
+if env_path.exists():
+    load_dotenv(dotenv_path=env_path)
+
+# Get Google Maps API key from environment variables
+google_maps_api_key = os.environ.get("GOOGLE_MAPS_API_KEY")
+
+jst = tz.gettz("Asia/Tokyo")
+
+
+def _output_csv(df: pd.DataFrame, dir_path: str, yyyymmdd: int) -> None:
+    # 相対パスの場合、スクリプトのディレクトリを基準に解決
+    if not os.path.isabs(dir_path):
+        dir_path = str(script_dir / dir_path)
+
+    os.makedirs(dir_path, exist_ok=True)
+    filename = os.path.join(dir_path, f"{yyyymmdd}.csv")
+    df.to_csv(filename, index=False)
+
+
+def _append_reject_summary(
+    df_summary: pd.DataFrame, filename: str, yyyymmdd: int
+) -> None:
+    """実行ごとの除外率をCSVに追記する"""
+    # 相対パスの場合、スクリプトのディレクトリを基準に解決
+    if not os.path.isabs(filename):
+        filename = str(script_dir / filename)
+
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    df = df_summary.assign(yyyymmdd=yyyymmdd)[["yyyymmdd", "reason", "count", "rate"]]
+    df.to_csv(filename, mode="a", index=False, header=not os.path.exists(filename))
+
+
+def _load_previous_csv(dir_path: str, yyyymmdd: int) -> pd.DataFrame | None:
+    """当日より前に保存された最新のCSVを読み込む。存在しない場合はNoneを返す"""
+    # 相対パスの場合、スクリプトのディレクトリを基準に解決
+    if not os.path.isabs(dir_path):
+        dir_path = str(script_dir / dir_path)
+
+    if not os.path.isdir(dir_path):
+        return None
+    filenames = sorted(
+        f
+        for f in os.listdir(dir_path)
+        if f.endswith(".csv") and f[:-4].isdigit() and int(f[:-4]) < yyyymmdd
+    )
+    if not filenames:
+        return None
+    logger.info(f"Previous snapshot: {filenames[-1]}")
+    return pd.read_csv(os.path.join(dir_path, filenames[-1]), dtype={"id": str})
+
+
+def create_spreadsheet() -> GcpSpreadSheet:
+    """環境変数と認証情報からGcpSpreadSheetを作成する
+
+    Raises:
+        ValueError: GOOGLE_SPREAD_SHEET_KEYが設定されていない場合
+    """
+    filename_credentials = str(script_dir / "credentials.json")
+
+    # 環境変数からスプレッドシートキーを取得
+    spreadsheet_key = os.environ.get("GOOGLE_SPREAD_SHEET_KEY")
+    if not spreadsheet_key:
+        raise ValueError(
+            "GOOGLE_SPREAD_SHEET_KEY environment variable is not set. "
+            "Please set it before running this script."
+        )
+
+    return GcpSpreadSheet(
+        key=spreadsheet_key,
+        filename_credentials=filename_credentials,
+    )
+
+
+def run_case(
+    case_name: str,
+    skip_spreadsheet: bool = False,
+    skip_csv_storing: bool = False,
+    dry_run: bool = False,
+    test_run: bool = False,
+    export_tiles: bool = False,
+    data_setting: dict | None = None,
+    session: requests.Session | None = None,
+    spreadsheet: GcpSpreadSheet | None = None,
+) -> None:
+    """1つのcaseについてスクレイピングから保存までを実行する
+
+    Args:
+        case_name (str): setting.ymlのtarget名
+        skip_spreadsheet (bool): Google Spreadsheetの更新をスキップするか
+        skip_csv_storing (bool): CSVの保存をスキップするか
+        dry_run (bool): 1ページのみスクレイピングし、保存をスキップするか
+        test_run (bool): 1ページのみスクレイピングし、'test'シートに書き込むか
+        export_tiles (bool): 地図表示用のGeoJSONとタイルを出力するか
+        data_setting (dict | None): 読み込み済みのsetting.yml。Noneの場合はファイルから読み込む
+        session (requests.Session | None): 共有するHTTPセッション
+        spreadsheet (GcpSpreadSheet | None): 共有するGcpSpreadSheet。Noneの場合は必要時に作成する
+
+    Returns:
+        None
+    """
+    now_jst = datetime.now(jst)
+    yyyymmdd = int(now_jst.strftime("%Y%m%d"))
+
+    # Dry run/Test runモードの場合、max_page=1に設定
+    max_page = 1 if dry_run or test_run else 1000
+
+    if dry_run:
+        logger.info("=== DRY RUN MODE ===")
+        logger.info("- Scraping only 1 page")
+        logger.info("- CSV saving disabled")
+        logger.info("- Google Spreadsheet update disabled")
+        logger.info("=" * 20)
+
+    if test_run:
+        logger.info("=== TEST RUN MODE ===")
+        logger.info("- Scraping only 1 page")
+        logger.info("- Data will be written to 'test' sheet in Google Spreadsheet")
+        logger.info("=" * 20)
+
+    scraper = Scraper(case_name, data_setting=data_setting, session=session)
+    scraper.extract_page(max_page=max_page)  # スクレイピング
+    scraper.validate_data()  # スクレイピング結果を検証し、不正な行を除外
+
+    # 結果データフレームをcsvに保存
+    # Dry runモードの場合は`data_dry/`ディレクトリに保存
+    if not skip_csv_storing and not dry_run:
+        data_root = "data"
+    else:
+        data_root = "data_dry"
+    # 以降の処理で失敗しても検証結果が残るよう、lakeと除外テーブルは先に保存する
+    _output_csv(scraper.df_lake, f"{data_root}/{case_name}/lake", yyyymmdd)
+    _output_csv(scraper.df_rejected, f"{data_root}/{case_name}/reject", yyyymmdd)
+    _append_reject_summary(
+        scraper.df_reject_summary,
+        f"{data_root}/{case_name}/reject_rate.csv",
+        yyyymmdd,
+    )
+
+    scraper.format_data()  # スクレイピング結果を整形
+    scraper.remove_replications(
+        group_cols=["price", "age", "area", "station_name"]
+    )  # grouping処理を行う
+
+    # 緯度・経度を追加してdf_martを作成
+    if not dry_run and google_maps_api_key is not None:
+        scraper.add_coordinates(google_maps_api_key)
+    else:
+        scraper.add_coordinates(
+            google_maps_api_key, is_dry_run=True
+        )  # "lat"と"lon"にNoneを設定
+
+    _output_csv(
+        scraper.df_formatted.sort_values("id"),
+        f"{data_root}/{case_name}/formatted",
+        yyyymmdd,
+    )
+    _output_csv(
+        scraper.df_mart.sort_values("id"), f"{data_root}/{case_name}/mart", yyyymmdd
+    )
+    # 地図表示用のGeoJSONとタイルを出力
+    # タイルは前回から変更された物件を含むものだけを再生成する
+    if export_tiles:
+        export_geojson(
+            scraper.df_mart,
+            str(script_dir / f"{data_root}/{case_name}/geojson/{yyyymmdd}.geojson"),
+        )
+        update_tiles(scraper.df_mart, str(script_dir / f"{data_root}/{case_name}/tiles"))
+
+    # Google Spreadsheetを更新
+    # Dry runモードの場合はスキップ
+    if not skip_spreadsheet and not dry_run:
+        logger.info("Updating Google Spreadsheet...")
+        # dfにタイムスタンプのカラムを追加
+        df_gss = scraper.df_mart.sort_values("id").copy()
+        df_gss["updated_at"] = now_jst.strftime("%Y-%m-%d %H:%M:%S")
+
+        if spreadsheet is None:
+            spreadsheet = create_spreadsheet()
+        sheet_name = (
+            "test" if test_run else "latest"
+        )  # テストランの場合はlatest_testシートに書き込む
+        spreadsheet.dump_dataframe(
+            df=df_gss,
+            sheet_name=sheet_name,
+        )
+
+    # 前回のdf_martと比較し、新規・変更された物件のみウォッチリストを評価
+    # ウォッチリストの失敗でデータの保存が妨げられないよう、最後に実行する
+    # 当日より前のスナップショットと比較するため、当日分の保存後でも結果は変わらない
+    # 今回martを保存したディレクトリと比較し、比較対象のスナップショットを実行ごとに進める
+    scraper.evaluate_watchlists(
+        _load_previous_csv(f"{data_root}/{case_name}/mart", yyyymmdd)
+    )
+    # ウォッチリストの一致物件はウォッチリストごとに保存
+    for watch_name, df_matched in scraper.watch_results.items():
+        if df_matched.empty:
+            continue
+        _output_csv(
+            df_matched.sort_values("id"),
+            f"{data_root}/{case_name}/watch/{watch_name}",
+            yyyymmdd,
+        )
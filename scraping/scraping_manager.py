@@ -1,5 +1,4 @@
 import os
-import time
 
 import duckdb
 import pandas as pd
@@ -8,24 +7,47 @@ from bs4 import BeautifulSoup
 from retry import retry
 
 from .src.core.formatter import format_data
+from .src.core.validator import summarize_rejects, validate_data
+from .src.core.watchlist import (
+    evaluate_watchlists,
+    extract_updated_rows,
+    validate_watchlists,
+)
 from .src.utils.geocoder import get_coordinates_from_address
 from .src.utils.logger import get_logger
+from .src.utils.rate_limiter import HostRateLimiter
 from .src.utils.yaml_handler import load_yaml
 
 logger = get_logger(__name__)
 
+# プロセス内のすべてのScraperで共有するレート制限（同一ホストへは5秒間隔）
+rate_limiter = HostRateLimiter(min_interval=5.0)
+# HTTPリクエストのタイムアウト（秒）
+REQUEST_TIMEOUT = 30
+
 
 class Scraper:
-    def __init__(self, case_name: str) -> None:
-        _filename_setting = os.path.join(os.path.dirname(__file__), "setting.yml")
-        _data_setting = load_yaml(_filename_setting)
-        self.data_target = _data_setting["target"][case_name]
+    def __init__(
+        self,
+        case_name: str,
+        data_setting: dict | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
+        if data_setting is None:
+            _filename_setting = os.path.join(os.path.dirname(__file__), "setting.yml")
+            data_setting = load_yaml(_filename_setting)
+        self.data_target = data_setting["target"][case_name]
         self.base_url = self.data_target["base_url"] + "&page={}"
+        # 設定ミスでスクレイピング後に失敗しないよう、ウォッチリストは先に検証する
+        validate_watchlists(self.data_target.get("watchlists") or {})
+        self.session = session if session is not None else requests.Session()
 
     @retry(tries=3, delay=10, backoff=2)
     def _parse_html(self, url: str):
         """URLのHTMLをパースする"""
-        r = requests.get(url)
+        rate_limiter.wait(url)
+        # 常駐モードでワーカーが停止しないよう、タイムアウト時は@retryで再試行する
+        r = self.session.get(url, timeout=REQUEST_TIMEOUT)
         soup = BeautifulSoup(r.content, "html.parser")
         return soup
 
@@ -100,12 +122,24 @@ class Scraper:
             if len(data_page) == 0:
                 break
             data_all_pages.extend(data_page)
-            time.sleep(5)
         self.df_lake = pd.DataFrame(data_all_pages)
         logger.info(f"Extracted {len(self.df_lake)} records.")
 
+    def validate_data(self) -> None:
+        """スクレイピングしたデータを検証し、不正な行を除外テーブルに振り分ける
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        logger.info("Starting data validation...")
+        self.df_validated, self.df_rejected = validate_data(self.df_lake)
+        self.df_reject_summary = summarize_rejects(len(self.df_lake), self.df_rejected)
+
     def format_data(self) -> None:
-        """スクレイピングしたデータを整形したDataFrameを作成する
+        """検証済みのデータを整形したDataFrameを作成する
 
         Args:
             None
@@ -114,7 +148,7 @@ class Scraper:
             None
         """
         logger.info("Starting data formatting...")
-        self.df_formatted = format_data(self.df_lake)
+        self.df_formatted = format_data(self.df_validated)
 
     def remove_replications(self, group_cols: list[str]) -> None:
         """重複物件を排除したDataFrameを作成する
@@ -165,7 +199,12 @@ class Scraper:
                     address, api_key, property_id
                 )
                 if coordinates:
-                    logger.info(f"取得成功: {address} -> {coordinates}")
+                    logger.info(
+                        "取得成功: %s -> %s",
+                        address,
+                        coordinates,
+                        extra={"aggregate": "geocode_success"},
+                    )
                     return pd.Series({"lat": coordinates[0], "lon": coordinates[1]})
                 else:
                     logger.warning(f"座標取得失敗: {address}")
@@ -177,7 +216,11 @@ class Scraper:
         # 各行に対して緯度・経度を取得
         # Dry runモードの場合はNoneを設定
         logger.info("is_dry_run: {}".format(is_dry_run))
-        if not is_dry_run:
+        if df.empty:
+            # 空のDataFrameにapplyするとlat/lonカラムが作成されないため
+            logger.info("No records: skipping coordinates")
+            coordinates_df = pd.DataFrame({"lat": [], "lon": []})
+        elif not is_dry_run:
             logger.info("Fetching coordinates from Google Maps API...")
             coordinates_df = df.apply(get_coordinates_for_row, axis=1)
         else:
@@ -187,3 +230,18 @@ class Scraper:
             )
         # 緯度・経度カラムを追加
         self.df_mart = df.assign(lat=coordinates_df["lat"], lon=coordinates_df["lon"])
+
+    def evaluate_watchlists(self, df_previous: pd.DataFrame | None) -> None:
+        """新規・変更された物件に対してウォッチリストを評価する
+
+        Args:
+            df_previous (pd.DataFrame | None): 前回実行時のdf_mart。Noneの場合は全件を評価
+
+        Returns:
+            None
+        """
+        watchlists = self.data_target.get("watchlists") or {}
+        self.df_updated = extract_updated_rows(self.df_mart, df_previous)
+        logger.info(f"Evaluating {len(watchlists)} watchlists...")
+        logger.info(f"New or changed records: {len(self.df_updated)}")
+        self.watch_results = evaluate_watchlists(self.df_updated, watchlists)
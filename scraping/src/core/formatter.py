@@ -4,10 +4,29 @@ import re
 import pandas as pd
 
 
+# 整形後のカラム
+FORMATTED_COLUMNS = [
+    "id",
+    "name",
+    "price",
+    "age",
+    "line",
+    "station_name",
+    "minutes",
+    "layout",
+    "area",
+    "address",
+    "url",
+]
+
+
 def format_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     scrapingしたデータを整形する
     """
+    # 全行が除外された場合などは、カラムのみの空のDataFrameを返す
+    if df.empty:
+        return pd.DataFrame(columns=FORMATTED_COLUMNS)
 
     # 金額
     def parse_price(price_str):
@@ -30,7 +49,10 @@ def format_data(df: pd.DataFrame) -> pd.DataFrame:
     # 面積m2
     df["area"] = df["area"].str.extract(r"(\d+(?:\.\d+)?)m2")
     # 築年数
-    df["yyyymm"] = pd.to_datetime(df["yyyymm_construction"], format="%Y年%m月")
+    # 変換できない値はNaTとし、後続のdropnaで除外する
+    df["yyyymm"] = pd.to_datetime(
+        df["yyyymm_construction"], format="%Y年%m月", errors="coerce"
+    )
     current_year = datetime.datetime.now().year
     df["age"] = current_year - df["yyyymm"].dt.year
     # 型変換
@@ -43,18 +65,5 @@ def format_data(df: pd.DataFrame) -> pd.DataFrame:
     df["id"] = df["url"].apply(
         lambda x: re.search(r"nc_(\d+)/", x).group(1) if isinstance(x, str) else None
     )
-    colums = [
-        "id",
-        "name",
-        "price",
-        "age",
-        "line",
-        "station_name",
-        "minutes",
-        "layout",
-        "area",
-        "address",
-        "url",
-    ]
-    df_formatted = df[colums]
+    df_formatted = df[FORMATTED_COLUMNS]
     return df_formatted
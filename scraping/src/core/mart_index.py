@@ -0,0 +1,122 @@
+"""
+df_martの検索用インデックス
+
+case・駅名・路線のハッシュインデックスと、価格・面積のソート済みインデックスを
+メモリ上に構築し、条件に一致する物件を全件走査せずに取得します。
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# ハッシュインデックスを構築するカラム
+CATEGORY_COLS = ["case", "station_name", "line"]
+# ソート済みインデックスを構築するカラム
+RANGE_COLS = ["price", "area"]
+# ソートに使用できるカラム
+SORTABLE_COLS = {"id", "price", "area", "age", "minutes"}
+
+
+class MartIndex:
+    """df_martの検索用インデックス
+
+    Args:
+        df (pd.DataFrame): caseカラムを含むdf_mart（複数caseを結合したもの）
+
+    Example:
+        >>> index = MartIndex(df)
+        >>> total, df_page = index.query(
+        ...     filters={"station_name": ["天神", "博多"]},
+        ...     ranges={"price": (None, 5000)},
+        ...     sort="-area",
+        ...     limit=20,
+        ... )
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df.reset_index(drop=True)
+        self._categories: Dict[str, Dict[str, np.ndarray]] = {
+            col: self.df.groupby(col).indices for col in CATEGORY_COLS
+        }
+        self._sorted: Dict[str, tuple] = {}
+        for col in RANGE_COLS:
+            values = self.df[col].to_numpy(dtype=float)
+            order = np.argsort(values, kind="stable")
+            self._sorted[col] = (values[order], order)
+        # 結果の行を毎回変換しないよう、レコードを事前に作成しておく
+        self._records = self.df.astype(object).where(self.df.notna(), None)
+        self._records = self._records.to_dict(orient="records")
+
+    def _lookup(self, col: str, values: List[str]) -> np.ndarray:
+        index = self._categories[col]
+        arrays = [index[v] for v in values if v in index]
+        return np.concatenate(arrays) if arrays else np.array([], dtype=int)
+
+    def _range(
+        self, col: str, min_value: Optional[float], max_value: Optional[float]
+    ) -> np.ndarray:
+        sorted_values, order = self._sorted[col]
+        lo = 0 if min_value is None else np.searchsorted(sorted_values, min_value)
+        hi = (
+            len(sorted_values)
+            if max_value is None
+            else np.searchsorted(sorted_values, max_value, side="right")
+        )
+        return order[lo:hi]
+
+    def query(
+        self,
+        filters: Optional[Dict[str, List[str]]] = None,
+        ranges: Optional[Dict[str, tuple]] = None,
+        sort: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple:
+        """条件に一致する物件を絞り込み、ソート・ページングして返す
+
+        Args:
+            filters (Optional[Dict[str, List[str]]]): カラム名と一致させる値のリスト
+            ranges (Optional[Dict[str, tuple]]): カラム名と(最小値, 最大値)。Noneは上限・下限なし
+            sort (Optional[str]): ソートするカラム名。先頭に`-`を付けると降順
+            limit (int): 返す件数
+            offset (int): 読み飛ばす件数
+
+        Returns:
+            tuple: (条件に一致した件数, 該当ページのレコードのリスト)
+
+        Raises:
+            ValueError: インデックスのないカラムやソートできないカラムを指定した場合
+        """
+        positions: Optional[np.ndarray] = None
+        for col, values in (filters or {}).items():
+            if col not in self._categories:
+                raise ValueError(f"検索できないカラムです: {col}")
+            matched = self._lookup(col, values)
+            positions = (
+                matched if positions is None else np.intersect1d(positions, matched)
+            )
+        for col, (min_value, max_value) in (ranges or {}).items():
+            if col not in self._sorted:
+                raise ValueError(f"範囲検索できないカラムです: {col}")
+            matched = self._range(col, min_value, max_value)
+            positions = (
+                matched if positions is None else np.intersect1d(positions, matched)
+            )
+        if positions is None:
+            positions = np.arange(len(self.df))
+
+        if sort:
+            col = sort.lstrip("-")
+            if col not in SORTABLE_COLS:
+                raise ValueError(f"ソートできないカラムです: {col}")
+            keys = self.df[col].to_numpy()[positions]
+            order = np.argsort(keys, kind="stable")
+            if sort.startswith("-"):
+                order = order[::-1]
+            positions = positions[order]
+        else:
+            positions = np.sort(positions)
+
+        page = positions[offset : offset + limit]
+        return len(positions), [self._records[i] for i in page]
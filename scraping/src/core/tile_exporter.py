@@ -0,0 +1,248 @@
+"""
+地図表示用のエクスポートユーティリティ
+
+緯度・経度を含むdf_martをGeoJSONとして出力し、ズームレベルごとのタイル（z/x/y）を生成します。
+低ズームでは物件をクラスタリングし、各タイルに集計値を付与します。
+タイルは前回実行時から変更された物件を含むものだけを再生成します。
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# タイルを生成するズームレベルの範囲
+MIN_ZOOM = 10
+MAX_ZOOM = 16
+# このズームレベル未満ではクラスタリングする
+CLUSTER_ZOOM = 14
+# クラスタリング時にタイルを分割する粒度（2**CLUSTER_SUBDIVISION 四方のグリッド）
+CLUSTER_SUBDIVISION = 3
+
+# Featureのpropertiesに含めるカラム
+PROPERTY_COLS = [
+    "id",
+    "name",
+    "price",
+    "age",
+    "line",
+    "station_name",
+    "minutes",
+    "layout",
+    "area",
+    "address",
+    "url",
+]
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def _tile_xy(
+    lat: np.ndarray, lon: np.ndarray, zoom: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """緯度・経度をWebメルカトルのタイル座標に変換する"""
+    n = 2**zoom
+    lat_rad = np.radians(np.clip(lat, -85.0511, 85.0511))
+    x = np.floor((lon + 180.0) / 360.0 * n)
+    y = np.floor((1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0 * n)
+    return np.clip(x, 0, n - 1).astype(int), np.clip(y, 0, n - 1).astype(int)
+
+
+def _geocoded(df: pd.DataFrame) -> pd.DataFrame:
+    """緯度・経度が取得できている行のみを返す"""
+    df_geo = df.dropna(subset=["lat", "lon"]).copy()
+    df_geo["id"] = df_geo["id"].astype(str)
+    df_geo["lat"] = df_geo["lat"].astype(float)
+    df_geo["lon"] = df_geo["lon"].astype(float)
+    return df_geo.reset_index(drop=True)
+
+
+def _features(df: pd.DataFrame) -> list:
+    """物件ごとのPoint Featureのリストを作成する"""
+    cols = [c for c in PROPERTY_COLS if c in df.columns]
+    properties = json.loads(df[cols].to_json(orient="records", force_ascii=False))
+    return [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            "properties": props,
+        }
+        for lon, lat, props in zip(df["lon"], df["lat"], properties)
+    ]
+
+
+def _cluster_features(df: pd.DataFrame, zoom: int) -> list:
+    """タイル内をグリッドに分割し、グリッドごとにクラスタのFeatureを作成する"""
+    cell_x, cell_y = _tile_xy(
+        df["lat"].to_numpy(), df["lon"].to_numpy(), zoom + CLUSTER_SUBDIVISION
+    )
+    df_cluster = (
+        df.assign(cell_x=cell_x, cell_y=cell_y)
+        .groupby(["cell_x", "cell_y"])
+        .agg(
+            lat=("lat", "mean"),
+            lon=("lon", "mean"),
+            n=("id", "size"),
+            price_mean=("price", "mean"),
+            price_min=("price", "min"),
+            price_max=("price", "max"),
+        )
+    )
+    return [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [row.lon, row.lat]},
+            "properties": {
+                "cluster": True,
+                "count": int(row.n),
+                "price_mean": round(float(row.price_mean), 1),
+                "price_min": int(row.price_min),
+                "price_max": int(row.price_max),
+            },
+        }
+        for row in df_cluster.itertuples()
+    ]
+
+
+def _aggregate(df: pd.DataFrame) -> Dict[str, float]:
+    """タイル単位の集計値を計算する"""
+    return {
+        "count": int(len(df)),
+        "price_mean": round(float(df["price"].mean()), 1),
+        "price_median": float(df["price"].median()),
+        "price_min": int(df["price"].min()),
+        "price_max": int(df["price"].max()),
+        "area_mean": round(float(df["area"].mean()), 2),
+    }
+
+
+def _write_json(data: dict, filename: str) -> None:
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def export_geojson(df: pd.DataFrame, filename: str) -> None:
+    """緯度・経度を含むDataFrameをGeoJSONとして出力する
+
+    Args:
+        df (pd.DataFrame): lat, lonカラムを含むDataFrame
+        filename (str): 出力先のファイルパス
+
+    Returns:
+        None
+    """
+    df_geo = _geocoded(df)
+    _write_json({"type": "FeatureCollection", "features": _features(df_geo)}, filename)
+    logger.info(f"GeoJSON has been written: {filename} ({len(df_geo)} features)")
+
+
+def _load_manifest(tile_dir: str) -> Optional[dict]:
+    filename = os.path.join(tile_dir, MANIFEST_FILENAME)
+    if not os.path.exists(filename):
+        return None
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Manifestが壊れています。全タイルを再生成します。: {e}")
+        return None
+
+
+def update_tiles(
+    df: pd.DataFrame,
+    tile_dir: str,
+    min_zoom: int = MIN_ZOOM,
+    max_zoom: int = MAX_ZOOM,
+    cluster_zoom: int = CLUSTER_ZOOM,
+) -> int:
+    """ズームレベルごとのタイルを差分更新する
+
+    前回実行時のmanifestと比較し、追加・変更・削除された物件を含むタイルのみを再生成します。
+    タイルは`{tile_dir}/{z}/{x}/{y}.geojson`に出力されます。
+
+    Args:
+        df (pd.DataFrame): lat, lonカラムを含むDataFrame
+        tile_dir (str): タイルの出力先ディレクトリ
+        min_zoom (int): 最小ズームレベル
+        max_zoom (int): 最大ズームレベル
+        cluster_zoom (int): このズームレベル未満ではクラスタリングする
+
+    Returns:
+        int: 再生成（または削除）したタイル数
+    """
+    df_geo = _geocoded(df)
+    config = {"min_zoom": min_zoom, "max_zoom": max_zoom, "cluster_zoom": cluster_zoom}
+
+    # 設定が変わった場合は既存のタイルを破棄して全件を再生成する
+    manifest = _load_manifest(tile_dir)
+    if manifest is None or manifest.get("config") != config:
+        if os.path.isdir(tile_dir):
+            shutil.rmtree(tile_dir)
+        manifest = {"config": config, "listings": {}}
+    previous = manifest["listings"]
+
+    # 物件ごとのハッシュで追加・変更を検知する
+    cols = [c for c in PROPERTY_COLS if c in df_geo.columns] + ["lat", "lon"]
+    hashes = pd.util.hash_pandas_object(df_geo[cols], index=False).astype(str)
+    prev_hashes = pd.Series({k: v["hash"] for k, v in previous.items()}, dtype=object)
+    is_changed = hashes.to_numpy() != prev_hashes.reindex(df_geo["id"]).to_numpy()
+    changed_ids = set(df_geo.loc[is_changed, "id"])
+    removed_ids = set(previous) - set(df_geo["id"])
+    # 移動・削除された物件は前回の位置のタイルも更新対象にする
+    stale = [previous[i] for i in (changed_ids | removed_ids) if i in previous]
+    stale_lat = np.array([v["lat"] for v in stale], dtype=float)
+    stale_lon = np.array([v["lon"] for v in stale], dtype=float)
+
+    lat = df_geo["lat"].to_numpy()
+    lon = df_geo["lon"].to_numpy()
+    n_updated = 0
+    for zoom in range(min_zoom, max_zoom + 1):
+        x, y = _tile_xy(lat, lon, zoom)
+        dirty: Set[Tuple[int, int]] = set(zip(x[is_changed], y[is_changed]))
+        if len(stale):
+            dirty |= set(zip(*_tile_xy(stale_lat, stale_lon, zoom)))
+        if not dirty:
+            continue
+
+        groups = pd.Series(0, index=df_geo.index).groupby([x, y]).indices
+        for tx, ty in dirty:
+            filename = os.path.join(tile_dir, str(zoom), str(tx), f"{ty}.geojson")
+            positions = groups.get((tx, ty))
+            if positions is None:
+                if os.path.exists(filename):
+                    os.remove(filename)
+                n_updated += 1
+                continue
+            df_tile = df_geo.iloc[positions]
+            if zoom < cluster_zoom:
+                features = _cluster_features(df_tile, zoom)
+            else:
+                features = _features(df_tile)
+            _write_json(
+                {
+                    "type": "FeatureCollection",
+                    "features": features,
+                    "aggregate": _aggregate(df_tile),
+                },
+                filename,
+            )
+            n_updated += 1
+
+    manifest["listings"] = {
+        i: {"hash": h, "lat": la, "lon": lo}
+        for i, h, la, lo in zip(df_geo["id"], hashes, lat, lon)
+    }
+    _write_json(manifest, os.path.join(tile_dir, MANIFEST_FILENAME))
+    logger.info(
+        f"Tiles updated: {n_updated} tiles "
+        f"({len(changed_ids)} changed, {len(removed_ids)} removed listings)"
+    )
+    return n_updated
@@ -0,0 +1,132 @@
+"""
+データ品質の検証ユーティリティ
+
+スクレイピング結果（lake）をスキーマに基づいて列単位でまとめて検証し、
+不正な行を理由コード付きの除外テーブルに振り分けます。
+"""
+
+from typing import Tuple
+
+import pandas as pd
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 除外率がこの値を超えた場合に警告する
+REJECT_RATE_WARNING = 0.05
+
+# lakeのスキーマ
+# required: 必須項目か
+# pattern: 値が満たすべき正規表現
+# range: (数値を抽出する正規表現, 最小値, 最大値)
+LAKE_SCHEMA = {
+    "name": {"required": True},
+    "price": {"required": True, "pattern": r"\d+(?:\.\d+)?(?:億|万)"},
+    "address": {"required": True},
+    "access": {
+        "required": True,
+        "pattern": r"「.+?」.*徒歩\d+分",
+        "range": (r"徒歩(\d+)分", 0, 120),
+    },
+    "area": {
+        "required": True,
+        "pattern": r"\d+(?:\.\d+)?m2",
+        "range": (r"(\d+(?:\.\d+)?)m2", 5, 1000),
+    },
+    "layout": {"required": True},
+    "yyyymm_construction": {
+        "required": True,
+        "pattern": r"^\d{4}年(?:[1-9]|1[0-2])月$",
+        "range": (r"^(\d{4})年", 1900, 2100),
+    },
+    "url": {"required": True, "pattern": r"nc_\d+/"},
+}
+
+
+def validate_data(
+    df: pd.DataFrame, schema: dict = LAKE_SCHEMA
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """スキーマに基づいてデータを検証し、正常な行と除外した行に分割する
+
+    理由コードは`{カラム名}:{missing|format|range}`の形式で、
+    複数のルールに違反した場合は`;`区切りで連結されます。
+
+    Args:
+        df (pd.DataFrame): スクレイピング結果のDataFrame
+        schema (dict): カラムごとの検証ルール
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: 正常な行のDataFrameと、
+            `reject_reason`カラムを付与した除外行のDataFrame
+    """
+    reasons = pd.Series("", index=df.index)
+    # 前後の空白を除去した値。検証した値と整形処理に渡す値を一致させる
+    stripped = {}
+
+    def _add_reason(mask: pd.Series, code: str) -> None:
+        reasons.loc[mask] = reasons.loc[mask] + code + ";"
+
+    for col, rule in schema.items():
+        if col not in df.columns:
+            if rule.get("required"):
+                _add_reason(pd.Series(True, index=df.index), f"{col}:missing")
+            continue
+
+        values = df[col].astype("string").str.strip()
+        stripped[col] = values
+        is_missing = values.isna() | (values == "")
+        if rule.get("required"):
+            _add_reason(is_missing, f"{col}:missing")
+
+        if "pattern" in rule:
+            matched = values.str.contains(rule["pattern"], regex=True)
+            _add_reason(~is_missing & ~matched.fillna(False), f"{col}:format")
+
+        if "range" in rule:
+            pattern, min_value, max_value = rule["range"]
+            number = pd.to_numeric(values.str.extract(pattern)[0], errors="coerce")
+            out_of_range = number.notna() & ~number.between(min_value, max_value)
+            _add_reason(out_of_range, f"{col}:range")
+
+    is_rejected = reasons != ""
+    df_valid = df[~is_rejected].copy()
+    for col, values in stripped.items():
+        df_valid[col] = values[~is_rejected].astype(object)
+    df_rejected = df[is_rejected].assign(
+        reject_reason=reasons[is_rejected].str.rstrip(";")
+    )
+    return df_valid, df_rejected
+
+
+def summarize_rejects(n_total: int, df_rejected: pd.DataFrame) -> pd.DataFrame:
+    """理由コードごとの除外件数と除外率を集計する
+
+    Args:
+        n_total (int): 検証した全行数
+        df_rejected (pd.DataFrame): validate_dataが返した除外行のDataFrame
+
+    Returns:
+        pd.DataFrame: reason, count, rateカラムを持つDataFrame。
+            reasonが`total`の行は除外された行全体の件数を表します。
+    """
+    counts = df_rejected["reject_reason"].str.split(";").explode().value_counts()
+    counts = counts.sort_index()
+    df_summary = pd.concat(
+        [
+            pd.DataFrame({"reason": ["total"], "count": [len(df_rejected)]}),
+            pd.DataFrame({"reason": counts.index, "count": counts.to_numpy()}),
+        ],
+        ignore_index=True,
+    )
+    df_summary["rate"] = (df_summary["count"] / n_total).round(4) if n_total else 0.0
+
+    for row in df_summary.itertuples():
+        logger.info(f"Rejected [{row.reason}]: {row.count} ({row.rate:.2%})")
+    total_rate = df_summary["rate"].iloc[0]
+    if total_rate > REJECT_RATE_WARNING:
+        logger.warning(
+            f"除外率が{REJECT_RATE_WARNING:.0%}を超えています: {total_rate:.2%}。"
+            "SUUMOのページ構造が変わった可能性があります。"
+        )
+    return df_summary
@@ -0,0 +1,182 @@
+"""
+ウォッチリストユーティリティ
+
+setting.ymlに定義した保存済み検索条件（ウォッチリスト）を、
+前回実行から新規追加・変更された物件に対してのみ評価します。
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 価格帯インデックスの幅（万円）
+PRICE_BAND_WIDTH = 500
+
+# 変更検知に使用するカラム
+# ageは年が変わるだけで全件が増えるため含めない（築年月は変わらない）
+COMPARE_COLS = ["price", "area", "station_name", "line", "minutes"]
+
+# ウォッチリストで指定可能な条件
+_CONDITION_KEYS = {
+    "stations",
+    "lines",
+    "min_price",
+    "max_price",
+    "min_area",
+    "max_area",
+    "max_age",
+    "max_minutes",
+}
+
+
+def extract_updated_rows(
+    df_current: pd.DataFrame, df_previous: Optional[pd.DataFrame]
+) -> pd.DataFrame:
+    """前回のスナップショットと比較して、新規または変更された物件を抽出する
+
+    Args:
+        df_current (pd.DataFrame): 今回のデータ
+        df_previous (Optional[pd.DataFrame]): 前回のデータ。Noneの場合は全件を新規とみなす
+
+    Returns:
+        pd.DataFrame: 新規または変更された物件のDataFrame
+    """
+    if df_previous is None or df_previous.empty:
+        return df_current.reset_index(drop=True)
+
+    current = df_current.assign(id=df_current["id"].astype(str))
+    previous = df_previous.assign(id=df_previous["id"].astype(str))
+    previous = previous.drop_duplicates(subset="id").set_index("id")
+
+    # 前回に存在しないIDは新規
+    is_new = ~current["id"].isin(previous.index)
+
+    # 前回に存在するIDは比較カラムのいずれかが変わっていれば変更とみなす
+    # 欠損による型変換（int -> float）を避けるため、既存IDのみで突き合わせる
+    is_changed = pd.Series(False, index=current.index)
+    existing = current[~is_new]
+    cols = [c for c in COMPARE_COLS if c in current.columns and c in previous.columns]
+    aligned = previous.loc[existing["id"], cols].set_axis(existing.index)
+    for col in cols:
+        cur = existing[col].astype(str)
+        prev = aligned[col].astype(str)
+        is_changed.loc[existing.index] |= cur != prev
+
+    return df_current[(is_new | is_changed).to_numpy()].reset_index(drop=True)
+
+
+class WatchlistIndex:
+    """駅名と価格帯のインデックス
+
+    ウォッチリストごとに全件を走査しないよう、候補行を事前に絞り込むために使用します。
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df.reset_index(drop=True)
+        self._all = np.arange(len(self.df))
+        self._by_station = self.df.groupby("station_name").indices
+        price_band = self.df["price"] // PRICE_BAND_WIDTH
+        self._by_band = {
+            int(k): v for k, v in price_band.groupby(price_band).indices.items()
+        }
+
+    def candidates(
+        self, stations: Optional[List[str]] = None, max_price: Optional[int] = None
+    ) -> np.ndarray:
+        """駅名・上限価格から候補行の位置を返す
+
+        Args:
+            stations (Optional[List[str]]): 対象の駅名リスト
+            max_price (Optional[int]): 上限価格（万円）
+
+        Returns:
+            np.ndarray: 候補行の位置
+        """
+        positions = self._all
+        if stations is not None:
+            arrays = [self._by_station[s] for s in stations if s in self._by_station]
+            positions = np.concatenate(arrays) if arrays else np.array([], dtype=int)
+        if max_price is not None:
+            max_band = max_price // PRICE_BAND_WIDTH
+            arrays = [v for k, v in self._by_band.items() if k <= max_band]
+            in_band = np.concatenate(arrays) if arrays else np.array([], dtype=int)
+            positions = np.intersect1d(positions, in_band)
+        return np.sort(positions)
+
+
+def _match(df: pd.DataFrame, conditions: dict) -> pd.DataFrame:
+    """候補行に対して残りの条件を適用する"""
+    mask = pd.Series(True, index=df.index)
+    if "lines" in conditions:
+        mask &= df["line"].isin(conditions["lines"])
+    if "min_price" in conditions:
+        mask &= df["price"] >= conditions["min_price"]
+    if "max_price" in conditions:
+        mask &= df["price"] <= conditions["max_price"]
+    if "min_area" in conditions:
+        mask &= df["area"] >= conditions["min_area"]
+    if "max_area" in conditions:
+        mask &= df["area"] <= conditions["max_area"]
+    if "max_age" in conditions:
+        mask &= df["age"] <= conditions["max_age"]
+    if "max_minutes" in conditions:
+        mask &= df["minutes"] <= conditions["max_minutes"]
+    return df[mask]
+
+
+def validate_watchlists(watchlists: Dict[str, dict]) -> None:
+    """ウォッチリストの条件に未知のキーが含まれていないか検証する
+
+    スクレイピングの前に設定ミスを検知するために使用します。
+
+    Args:
+        watchlists (Dict[str, dict]): ウォッチリスト名と条件の辞書
+
+    Raises:
+        ValueError: 未知の条件が指定された場合
+    """
+    for name, conditions in watchlists.items():
+        unknown = set(conditions or {}) - _CONDITION_KEYS
+        if unknown:
+            raise ValueError(
+                f"ウォッチリスト'{name}'に未知の条件が含まれています: {sorted(unknown)}"
+            )
+
+
+def evaluate_watchlists(
+    df: pd.DataFrame, watchlists: Dict[str, dict]
+) -> Dict[str, pd.DataFrame]:
+    """ウォッチリストを評価し、ウォッチリストごとの一致物件を返す
+
+    Args:
+        df (pd.DataFrame): 評価対象のデータ（新規・変更された物件）
+        watchlists (Dict[str, dict]): ウォッチリスト名と条件の辞書
+
+    Returns:
+        Dict[str, pd.DataFrame]: ウォッチリスト名と一致物件のDataFrameの辞書
+
+    Raises:
+        ValueError: 未知の条件が指定された場合
+
+    Example:
+        >>> watchlists = {"tenjin": {"stations": ["天神"], "max_price": 4000}}
+        >>> results = evaluate_watchlists(df, watchlists)
+    """
+    validate_watchlists(watchlists)
+
+    index = WatchlistIndex(df)
+    results = {}
+    for name, conditions in watchlists.items():
+        positions = index.candidates(
+            stations=conditions.get("stations"),
+            max_price=conditions.get("max_price"),
+        )
+        df_matched = _match(index.df.iloc[positions], conditions)
+        logger.info(f"Watchlist '{name}': {len(df_matched)} matched.")
+        results[name] = df_matched
+    return results
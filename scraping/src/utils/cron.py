@@ -0,0 +1,96 @@
+"""
+cron形式のスケジュールユーティリティ
+
+`分 時 日 月 曜日`の5フィールドからなるcron式を解釈し、次回の実行時刻を計算します。
+各フィールドでは`*`、数値、範囲（`1-5`）、リスト（`1,3`）、ステップ（`*/15`）が使用できます。
+"""
+
+from datetime import datetime, timedelta
+from typing import Set
+
+# (最小値, 最大値)
+_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+
+def _parse_field(field: str, min_value: int, max_value: int) -> Set[int]:
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            step = int(step_str)
+        if part == "*":
+            start, end = min_value, max_value
+        elif "-" in part:
+            start, end = (int(v) for v in part.split("-", 1))
+        else:
+            start = int(part)
+            end = max_value if step > 1 else start
+        if start < min_value or end > max_value or start > end or step < 1:
+            raise ValueError(f"cron式の値が範囲外です: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """cron式のスケジュール
+
+    Args:
+        expression (str): cron式（例: "0 10 * * 1"）。曜日は0が日曜日
+
+    Raises:
+        ValueError: cron式が不正な場合
+
+    Example:
+        >>> schedule = CronSchedule("0 10 * * 1")
+        >>> schedule.next_after(datetime(2026, 2, 9, 9, 0))
+        datetime.datetime(2026, 2, 9, 10, 0)
+    """
+
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron式は5つのフィールドが必要です: {expression}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            _parse_field(field, *field_range)
+            for field, field_range in zip(fields, _FIELD_RANGES)
+        )
+        # cronと同様に、日と曜日の両方が指定された場合はどちらかに一致すればよい
+        self._day_restricted = fields[2] != "*"
+        self._weekday_restricted = fields[4] != "*"
+        # 7を日曜日として扱う
+        self.weekdays = {0 if w == 7 else w for w in self.weekdays}
+
+    def _match_day(self, dt: datetime) -> bool:
+        weekday = (dt.weekday() + 1) % 7  # cronは日曜日が0
+        day_match = dt.day in self.days
+        weekday_match = weekday in self.weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def next_after(self, dt: datetime) -> datetime:
+        """指定した時刻より後の次回実行時刻を返す
+
+        Args:
+            dt (datetime): 基準時刻
+
+        Returns:
+            datetime: 次回実行時刻（基準時刻と同じタイムゾーン）
+        """
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # 最大でも約4年先までに一致する時刻が存在する
+        limit = candidate + timedelta(days=366 * 4)
+        while candidate < limit:
+            if candidate.month not in self.months or not self._match_day(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise ValueError(f"cron式に一致する時刻がありません: {self.expression}")
@@ -7,6 +7,7 @@ Google Maps Platform の Geocoding API を使用します。
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 import googlemaps
@@ -21,6 +22,9 @@ CACHE_FILE_PATH = os.path.join(
     os.path.dirname(__file__), "../../data/geocoding_api_history.json"
 )
 
+# プロセス内で共有するCache（_get_cacheで読み込む）
+_cache: Optional[Dict[str, Dict[str, float]]] = None
+
 
 def _load_cache() -> Dict[str, Dict[str, float]]:
     """Cacheファイルから過去のgeocoding結果を読み込む
@@ -95,6 +99,20 @@ def _save_cache(cache: Dict[str, Dict[str, float]]) -> None:
         logger.error("Cacheファイルの保存に失敗しました")
 
 
+def _get_cache() -> Dict[str, Dict[str, float]]:
+    """プロセス内で共有するCacheを返す。初回呼び出し時にCacheファイルから読み込む"""
+    global _cache
+    if _cache is None:
+        _cache = _load_cache()
+    return _cache
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> googlemaps.Client:
+    """APIキーごとにGoogle Mapsクライアントを作成し、再利用する"""
+    return googlemaps.Client(key=api_key)
+
+
 def get_coordinates_from_address(
     address: str, api_key: str, property_id: Optional[str] = None
 ) -> Optional[Tuple[float, float]]:
@@ -131,6 +149,7 @@ def get_coordinates_from_address(
         - レート制限やクォータ制限がある場合があります
         - ネットワークエラーやAPIエラーが発生した場合はNoneを返します
         - property_idが指定されている場合、過去の結果をCacheから取得します
+        - Cacheファイルは同一プロセス内で初回のみ読み込み、以降はメモリ上のCacheを使用します
         - 並行実行には対応していません。複数プロセスでの同時実行時はCacheの競合が発生する可能性があります
     """
     # 入力値の検証
@@ -140,8 +159,8 @@ def get_coordinates_from_address(
     if not api_key or not api_key.strip():
         raise ValueError("APIキーが空です")
 
-    # Cacheの読み込み
-    cache = _load_cache()
+    # Cacheの読み込み（同一プロセス内では初回のみファイルから読み込む）
+    cache = _get_cache()
 
     # property_idが指定されている場合、Cacheを確認
     if property_id and str(property_id) in cache:
@@ -159,8 +178,8 @@ def get_coordinates_from_address(
 
     # APIを呼び出す
     try:
-        # Google Maps クライアントを初期化
-        gmaps = googlemaps.Client(key=api_key)
+        # Google Maps クライアントを取得
+        gmaps = _get_client(api_key)
         # geocodingを実行
         geocode_result = gmaps.geocode(address)
         # 結果が空の場合
@@ -180,7 +199,11 @@ def get_coordinates_from_address(
         if property_id:
             cache[str(property_id)] = {"lat": latitude, "lon": longitude}
             _save_cache(cache)
-            logger.info(f"Cacheに保存しました: id={property_id}")
+            logger.info(
+                "Cacheに保存しました: id=%s",
+                property_id,
+                extra={"aggregate": "geocode_cache_save"},
+            )
 
         return (latitude, longitude)
 
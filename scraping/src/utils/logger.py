@@ -2,13 +2,163 @@
 カスタムロガーユーティリティ
 
 開発やログの確認のための一般的なロガーを提供します。
+configure_logging()を呼び出すと、出力をバックグラウンドスレッドで行うキューモードに切り替わり、
+高頻度のログの集約やJSON形式での出力が利用できます。
 """
 
+import atexit
+import json
 import logging
+import queue
 import re
 import sys
+import threading
+from collections import defaultdict
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+# get_loggerで作成したロガー
+_managed_loggers: Dict[str, logging.Logger] = {}
+# キューモードの状態
+_queue_handler: Optional[QueueHandler] = None
+_queue_listener: Optional[QueueListener] = None
+_aggregating_filter: Optional["_AggregatingFilter"] = None
+_dispatch_handler: Optional["_DispatchHandler"] = None
+_json_format = False
+
+_STANDARD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """ログレコードを1行のJSONとして出力するフォーマッタ
+
+    `extra`で渡された属性もJSONのフィールドとして出力します。
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+def _create_formatter() -> logging.Formatter:
+    if _json_format:
+        return JsonFormatter()
+    return logging.Formatter(
+        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+class _AsyncQueueHandler(QueueHandler):
+    """メッセージの整形をリスナースレッドに任せるQueueHandler
+
+    標準のQueueHandlerは呼び出し元スレッドでメッセージを整形するため、
+    レコードをそのままキューに積みます。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _DispatchHandler(logging.Handler):
+    """リスナースレッドで、ロガー名ごとに元のハンドラへレコードを振り分ける"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.handlers: Dict[str, List[logging.Handler]] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers.get(record.name, []):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _AggregatingFilter(logging.Filter):
+    """`extra={"aggregate": <key>}`付きのログを集約するフィルタ
+
+    キーごとに最初の`sample_first`件のみを出力し、それ以降は件数のみを数えます。
+    抑制した件数のサマリーは、タイマースレッドが`interval`秒ごとに出力します。
+    """
+
+    def __init__(self, handler: QueueHandler, interval: float, sample_first: int):
+        super().__init__()
+        self.handler = handler
+        self.interval = interval
+        self.sample_first = sample_first
+        self._lock = threading.Lock()
+        self._seen: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._suppressed: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._last: Dict[Tuple[str, str], logging.LogRecord] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        aggregate = getattr(record, "aggregate", None)
+        if aggregate is None:
+            return True
+
+        key = (record.name, aggregate)
+        with self._lock:
+            self._seen[key] += 1
+            passed = self._seen[key] <= self.sample_first
+            if not passed:
+                self._suppressed[key] += 1
+                self._last[key] = record
+        return passed
+
+    def start(self) -> None:
+        """サマリーを定期的に出力するタイマースレッドを起動する"""
+        self._thread = threading.Thread(
+            target=self._run, name="log-aggregator", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """タイマースレッドを停止し、残っているサマリーを出力する"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        # 他のログが出力されない間も、interval秒ごとにサマリーを出力する
+        while not self._stop.wait(timeout=self.interval):
+            self.flush()
+
+    def flush(self) -> None:
+        """抑制した件数のサマリーをキューに積む"""
+        with self._lock:
+            suppressed = dict(self._suppressed)
+            last = dict(self._last)
+            self._suppressed.clear()
+            self._last.clear()
+
+        for (name, aggregate), count in suppressed.items():
+            record = last[(name, aggregate)]
+            summary = logging.makeLogRecord(
+                {
+                    "name": name,
+                    "levelno": record.levelno,
+                    "levelname": record.levelname,
+                    "msg": "[%s] %d件のログを集約しました（最終: %s）",
+                    "args": (aggregate, count, record.getMessage()),
+                    "aggregate": aggregate,
+                    "count": count,
+                }
+            )
+            # filterを通さずに直接キューに積む
+            self.handler.emit(summary)
 
 
 def get_logger(
@@ -48,10 +198,7 @@ def get_logger(
         return logger
 
     # フォーマッタを作成
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    formatter = _create_formatter()
 
     # コンソールハンドラを追加
     console_handler = logging.StreamHandler(sys.stdout)
@@ -78,9 +225,105 @@ def get_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
+    _managed_loggers[name] = logger
+    # キューモードが有効な場合、後から作成されたロガーもキュー経由にする
+    if _queue_handler is not None:
+        _attach_queue(logger)
+
     return logger
 
 
+def _attach_queue(logger: logging.Logger) -> None:
+    """ロガーのハンドラをリスナースレッド側に移し、QueueHandlerに置き換える"""
+    handlers = [h for h in logger.handlers if h is not _queue_handler]
+    _dispatch_handler.handlers[logger.name] = handlers
+    for handler in handlers:
+        logger.removeHandler(handler)
+    if _queue_handler not in logger.handlers:
+        logger.addHandler(_queue_handler)
+
+
+def configure_logging(
+    use_queue: bool = True,
+    json_format: bool = False,
+    aggregate_interval: float = 10.0,
+    sample_first: int = 1,
+) -> None:
+    """ログ出力のモードを設定する
+
+    get_loggerで作成済みのロガーと、以降に作成されるロガーの両方に適用されます。
+
+    Args:
+        use_queue (bool): キューモードを有効にするか。有効な場合、ログの出力は
+            バックグラウンドのリスナースレッドで行われます（デフォルト: True）
+        json_format (bool): ログを1行のJSONとして出力するか（デフォルト: False）
+        aggregate_interval (float): 集約したログのサマリーを出力する間隔（秒）
+        sample_first (int): 集約対象のログを、キーごとに何件まで個別に出力するか
+
+    Example:
+        >>> configure_logging(json_format=True)
+        >>> logger = get_logger(__name__)
+        >>> for address in addresses:
+        ...     logger.info("取得成功: %s", address, extra={"aggregate": "geocode"})
+
+    Note:
+        `extra={"aggregate": <key>}`を付けたログはキューモードでのみ集約されます。
+        プロセス終了時に、未出力のサマリーとキューに残ったログを出力します。
+    """
+    global _json_format, _queue_handler, _queue_listener
+    global _aggregating_filter, _dispatch_handler
+
+    shutdown_logging()
+
+    _json_format = json_format
+    for logger in _managed_loggers.values():
+        for handler in logger.handlers:
+            handler.setFormatter(_create_formatter())
+
+    if not use_queue:
+        return
+
+    _queue_handler = _AsyncQueueHandler(queue.SimpleQueue())
+    _aggregating_filter = _AggregatingFilter(
+        _queue_handler, interval=aggregate_interval, sample_first=sample_first
+    )
+    _queue_handler.addFilter(_aggregating_filter)
+    _dispatch_handler = _DispatchHandler()
+    for logger in _managed_loggers.values():
+        _attach_queue(logger)
+
+    _queue_listener = QueueListener(_queue_handler.queue, _dispatch_handler)
+    _queue_listener.start()
+    _aggregating_filter.start()
+
+
+def shutdown_logging() -> None:
+    """キューモードを停止し、ロガーのハンドラを元に戻す
+
+    集約中のサマリーとキューに残ったログはすべて出力されます。
+    """
+    global _queue_handler, _queue_listener, _aggregating_filter, _dispatch_handler
+
+    if _queue_listener is None:
+        return
+
+    _aggregating_filter.stop()
+    _queue_listener.stop()
+    for name, handlers in _dispatch_handler.handlers.items():
+        logger = _managed_loggers[name]
+        logger.removeHandler(_queue_handler)
+        for handler in handlers:
+            logger.addHandler(handler)
+
+    _queue_handler = None
+    _queue_listener = None
+    _aggregating_filter = None
+    _dispatch_handler = None
+
+
+atexit.register(shutdown_logging)
+
+
 def setup_root_logger(level: int = logging.INFO) -> None:
     """ルートロガーをセットアップする
 
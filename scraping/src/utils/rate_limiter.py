@@ -0,0 +1,42 @@
+"""
+レート制限ユーティリティ
+
+同一ホストへのリクエスト間隔を、プロセス内のすべての呼び出し元で共有して制御します。
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """ホストごとにリクエストの最小間隔を保証する
+
+    Args:
+        min_interval (float): 同一ホストへのリクエストの最小間隔（秒）
+
+    Example:
+        >>> limiter = HostRateLimiter(min_interval=5.0)
+        >>> limiter.wait("https://suumo.jp/jj/bukken/ichiran/")
+        >>> r = requests.get("https://suumo.jp/jj/bukken/ichiran/")
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """URLのホストに対してリクエスト可能になるまで待機する
+
+        Args:
+            url (str): リクエスト先のURL
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = scheduled + self.min_interval
+        if scheduled > now:
+            time.sleep(scheduled - now)
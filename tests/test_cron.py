@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+
+from scraping.src.utils.cron import CronSchedule
+
+# 2026-02-09は月曜日
+MONDAY = datetime(2026, 2, 9, 9, 0)
+
+
+def test_next_after_weekday():
+    """曜日指定は当日の実行時刻前なら当日、過ぎていれば翌週になる"""
+    schedule = CronSchedule("0 10 * * 1")
+    assert schedule.next_after(MONDAY) == datetime(2026, 2, 9, 10, 0)
+    assert schedule.next_after(datetime(2026, 2, 9, 10, 0)) == datetime(
+        2026, 2, 16, 10, 0
+    )
+
+
+def test_next_after_sunday_as_7():
+    """曜日の7は0と同じく日曜日として扱う"""
+    assert CronSchedule("0 0 * * 7").next_after(MONDAY) == datetime(2026, 2, 15)
+    assert CronSchedule("0 0 * * 0").next_after(MONDAY) == datetime(2026, 2, 15)
+
+
+def test_next_after_step():
+    """`*/15`は0分から、`5/20`は5分から指定した間隔で実行する"""
+    schedule = CronSchedule("*/15 * * * *")
+    assert schedule.next_after(datetime(2026, 2, 9, 9, 7)) == datetime(
+        2026, 2, 9, 9, 15
+    )
+    assert schedule.next_after(datetime(2026, 2, 9, 9, 45)) == datetime(
+        2026, 2, 9, 10, 0
+    )
+
+    schedule = CronSchedule("5/20 * * * *")
+    assert schedule.minutes == {5, 25, 45}
+    assert schedule.next_after(datetime(2026, 2, 9, 9, 5)) == datetime(
+        2026, 2, 9, 9, 25
+    )
+    assert schedule.next_after(datetime(2026, 2, 9, 9, 50)) == datetime(
+        2026, 2, 9, 10, 5
+    )
+
+
+def test_next_after_day_or_weekday():
+    """日と曜日の両方を指定した場合は、どちらかに一致すれば実行する"""
+    schedule = CronSchedule("0 9 1 * 1")
+    # 2026-02-28(土)の次は3/1(日)が日の指定に一致する
+    assert schedule.next_after(datetime(2026, 2, 28)) == datetime(2026, 3, 1, 9, 0)
+    # 3/1の次は3/2(月)が曜日の指定に一致する
+    assert schedule.next_after(datetime(2026, 3, 1, 9, 0)) == datetime(
+        2026, 3, 2, 9, 0
+    )
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "0 10 * *",  # フィールド数が不足
+        "0 10 * * 1 *",  # フィールド数が過剰
+        "60 * * * *",  # 分が範囲外
+        "0 24 * * *",  # 時が範囲外
+        "0 0 0 * *",  # 日が範囲外
+        "0 0 * 13 *",  # 月が範囲外
+        "0 0 * * 8",  # 曜日が範囲外
+        "0 0 * * 5-1",  # 範囲の開始が終了より大きい
+        "*/0 * * * *",  # ステップが0
+    ],
+)
+def test_invalid_expression(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_next_after_impossible_date():
+    """存在しない日付のみを指定した場合は、次回実行時刻の計算で検知する"""
+    schedule = CronSchedule("0 0 31 2 *")
+    with pytest.raises(ValueError, match="一致する時刻がありません"):
+        schedule.next_after(MONDAY)
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from scraping import runner
+from scraping.scraping_manager import Scraper
+
+DATA_SETTING = {"target": {"case": {"base_url": "https://suumo.jp/?ar=090"}}}
+
+
+def test_run_case_all_rejected(monkeypatch, tmp_path):
+    """全行が検証で除外されても、lake・除外テーブル・除外率が保存される"""
+    rows = [
+        {
+            "name": name,
+            "price": "価格未定",
+            "address": "福岡県福岡市中央区",
+            "access": "地下鉄空港線「天神」徒歩5分",
+            "area": "60.0m2",
+            "layout": "2LDK",
+            "yyyymm_construction": "2010年3月",
+            "url": f"https://suumo.jp//ms/chuko/nc_{i}/",
+        }
+        for i, name in enumerate(["A", "B"])
+    ]
+
+    def _extract_page(self, max_page):
+        self.df_lake = pd.DataFrame(rows)
+
+    monkeypatch.setattr(Scraper, "extract_page", _extract_page)
+    monkeypatch.setattr(runner, "script_dir", tmp_path)
+
+    runner.run_case("case", dry_run=True, data_setting=DATA_SETTING)
+
+    case_dir = tmp_path / "data_dry" / "case"
+    df_reject = pd.read_csv(next((case_dir / "reject").glob("*.csv")))
+    assert df_reject["reject_reason"].tolist() == ["price:format", "price:format"]
+    assert len(pd.read_csv(next((case_dir / "lake").glob("*.csv")))) == 2
+    df_rate = pd.read_csv(case_dir / "reject_rate.csv")
+    assert df_rate.loc[df_rate["reason"] == "total", "rate"].item() == 1.0
+    df_mart = pd.read_csv(next((case_dir / "mart").glob("*.csv")))
+    assert df_mart.empty
+    assert {"id", "price", "lat", "lon"} <= set(df_mart.columns)
+
+
+def test_run_case_padded_values(monkeypatch, tmp_path):
+    """前後に空白を含む値も、検証を通過した行は整形で失敗しない"""
+    row = {
+        "name": "A",
+        "price": " 3980万円 ",
+        "address": "福岡県福岡市中央区",
+        "access": "地下鉄空港線「天神」徒歩5分",
+        "area": "60.0m2",
+        "layout": "2LDK",
+        "yyyymm_construction": " 1984年3月\n",
+        "url": "https://suumo.jp//ms/chuko/nc_1/",
+    }
+
+    def _extract_page(self, max_page):
+        self.df_lake = pd.DataFrame([row])
+
+    monkeypatch.setattr(Scraper, "extract_page", _extract_page)
+    monkeypatch.setattr(runner, "script_dir", tmp_path)
+
+    runner.run_case("case", dry_run=True, data_setting=DATA_SETTING)
+
+    case_dir = tmp_path / "data_dry" / "case"
+    df_mart = pd.read_csv(next((case_dir / "mart").glob("*.csv")))
+    assert df_mart["price"].tolist() == [3980]
+    assert df_mart["age"].tolist() == [datetime.now().year - 1984]
+
+
+def test_scraper_rejects_unknown_watchlist_key():
+    """ウォッチリストの設定ミスはスクレイピング前に検知される"""
+    data_setting = {
+        "target": {
+            "case": {
+                "base_url": "https://suumo.jp/?ar=090",
+                "watchlists": {"typo": {"max_prce": 3000}},
+            }
+        }
+    }
+    with pytest.raises(ValueError, match="max_prce"):
+        Scraper("case", data_setting=data_setting)
@@ -0,0 +1,58 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from scraping.src.core.tile_exporter import MANIFEST_FILENAME, update_tiles
+
+
+def _make_mart(n: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": [str(100000 + i) for i in range(n)],
+            "name": [f"物件{i}" for i in range(n)],
+            "price": rng.integers(1000, 8000, n),
+            "age": rng.integers(0, 40, n),
+            "line": "地下鉄空港線",
+            "station_name": rng.choice(["天神", "博多", "赤坂"], n),
+            "minutes": rng.integers(1, 20, n),
+            "layout": "3LDK",
+            "area": rng.uniform(40, 100, n).round(2),
+            "address": "福岡県福岡市中央区",
+            "url": [f"https://suumo.jp//ms/chuko/nc_{100000 + i}/" for i in range(n)],
+            "lat": 33.59 + rng.uniform(-0.05, 0.05, n),
+            "lon": 130.40 + rng.uniform(-0.05, 0.05, n),
+        }
+    )
+
+
+def _read_tiles(tile_dir) -> dict:
+    return {
+        str(path.relative_to(tile_dir)): json.loads(path.read_text(encoding="utf-8"))
+        for path in tile_dir.rglob("*.geojson")
+    }
+
+
+def test_update_tiles_matches_full_rebuild(tmp_path):
+    """差分更新の結果が、全件から再生成したタイルと一致する"""
+    df = _make_mart()
+    incremental_dir = tmp_path / "incremental"
+    assert update_tiles(df, str(incremental_dir)) > 0
+
+    # 価格の変更・位置の移動・物件の削除
+    df_next = df.copy()
+    df_next.loc[:9, "price"] += 100
+    df_next.loc[10:19, "lat"] += 0.02
+    df_next.loc[10:19, "lon"] -= 0.02
+    df_next = df_next.drop(index=range(20, 30)).reset_index(drop=True)
+    assert update_tiles(df_next, str(incremental_dir)) > 0
+
+    rebuild_dir = tmp_path / "rebuild"
+    update_tiles(df_next, str(rebuild_dir))
+    assert _read_tiles(incremental_dir) == _read_tiles(rebuild_dir)
+    manifest = json.loads((incremental_dir / MANIFEST_FILENAME).read_text())
+    assert set(manifest["listings"]) == set(df_next["id"])
+
+    # 変更がなければタイルは再生成されない
+    assert update_tiles(df_next, str(incremental_dir)) == 0